@@ -2,19 +2,27 @@ import requests
 
 TED_API = "https://ted.europa.eu/api/v2/notices/search"
 
+# Session partagée : une seule connexion TLS réutilisée entre les appels
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+
 def search_ted(keyword: str, limit=20):
     params = {
         "text": keyword,
         "limit": limit
     }
-    resp = requests.get(TED_API, params=params)
+    resp = SESSION.get(TED_API, params=params, timeout=10)
     resp.raise_for_status()
     return resp.json()
 
 def get_ted_notice(notice_id: str):
     url = f"https://ted.europa.eu/api/v2/notices/{notice_id}"
-    resp = requests.get(url)
+    resp = SESSION.get(url, timeout=10)
     resp.raise_for_status()
     return resp.json()
 
-print(search_ted("géomètre"))
+def main():
+    print(search_ted("géomètre"))
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 # run_pipeline.py
 from __future__ import annotations
 
-import subprocess
+import importlib
 import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import os
@@ -10,46 +12,62 @@ import os
 
 ROOT = Path(__file__).resolve().parent
 SRC_DIR = ROOT / "src"
-SCRIPTS_DIR = ROOT / "scripts"
 WEB_DIR = ROOT / "src" / "marches_geometre" / "web"
 FINAL_JSON = WEB_DIR / "normalized_geometre_latest.json"
 
+# Les étapes tournent dans ce process : src/ et scripts/ doivent être importables
+for _path in (SRC_DIR, ROOT):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
 
-STEPS = [
-    ("fetch_boamp", SCRIPTS_DIR / "fetch_boamp.py"),
-    ("fetch_maximilien_geometre_idf", SCRIPTS_DIR / "fetch_maximilien_geometre_idf.py"),
-    ("fetch_mp_info", SCRIPTS_DIR / "fetch_mp_info.py"),
-    ("normalize_today", SCRIPTS_DIR / "normalize_today.py"),
-    ("prepare_web_data", SCRIPTS_DIR / "prepare_web_data.py"),
+
+# (nom, "module:fonction") -> fonction main() de chaque script
+
+# Collecteurs indépendants (sites et fichiers distincts) : lancés en parallèle
+FETCH_STEPS = [
+    ("fetch_boamp", "scripts.fetch_boamp:main"),
+    ("fetch_maximilien_geometre_idf", "scripts.fetch_maximilien_geometre_idf:main"),
+    ("fetch_mp_info", "scripts.fetch_mp_info:main"),
+]
+
+# Traitements qui dépendent des collectes : lancés ensuite, dans l'ordre
+PROCESS_STEPS = [
+    ("normalize_today", "scripts.normalize_today:main"),
+    ("prepare_web_data", "scripts.prepare_web_data:main"),
 ]
 
 
-def run_step(name: str, script_path: Path) -> None:
+def run_step(name: str, entry: str) -> None:
     print(f"\n=== Étape: {name} ===")
-    print(f"-> python {script_path.relative_to(ROOT)}")
-
-    # On part de l'env courant
-    env = os.environ.copy()
-
-    # On préfixe le PYTHONPATH avec src/
-    existing = env.get("PYTHONPATH", "")
-    new_pythonpath = str(SRC_DIR)
-    if existing:
-        new_pythonpath += os.pathsep + existing
-    env["PYTHONPATH"] = new_pythonpath
-
-    result = subprocess.run(
-        [sys.executable, str(script_path)],
-        cwd=str(ROOT),
-        env=env,
-        check=False,
-    )
-
-    if result.returncode != 0:
+    print(f"-> {entry}")
+
+    module_path, func_name = entry.split(":")
+
+    try:
+        module = importlib.import_module(module_path)
+        step_main = getattr(module, func_name)
+        step_main()
+    except Exception as exc:
+        print(f"Erreur pendant l'étape '{name}': {exc!r}")
+        # trace complète dans le log (comme le faisait le sous-process)
+        traceback.print_exc()
         raise RuntimeError(
-            f"Échec de l'étape '{name}' (code retour={result.returncode}). "
-            "Arrêt du pipeline."
-        )
+            f"Échec de l'étape '{name}'. Arrêt du pipeline."
+        ) from exc
+
+
+def run_fetch_steps() -> None:
+    """
+    Lance toutes les collectes en même temps : la durée totale est celle de
+    la plus lente, pas la somme des trois.
+
+    Toutes les collectes vont à leur terme ; la première erreur est relevée ensuite.
+    """
+    with ThreadPoolExecutor(max_workers=len(FETCH_STEPS)) as executor:
+        futures = [executor.submit(run_step, name, entry) for name, entry in FETCH_STEPS]
+
+    for future in futures:
+        future.result()
 
 
 def main() -> None:
@@ -59,8 +77,16 @@ def main() -> None:
     print(f"Racine projet : {ROOT}")
     print(f"Date/heure    : {datetime.now().isoformat(timespec='seconds')}")
 
-    for name, script in STEPS:
-        run_step(name, script)
+    # Les scripts travaillent en chemins relatifs (data/...) depuis la racine
+    os.chdir(ROOT)
+
+    from marches_geometre.persistence.paths import ensure_data_dirs
+    ensure_data_dirs()
+
+    run_fetch_steps()
+
+    for name, entry in PROCESS_STEPS:
+        run_step(name, entry)
 
     if FINAL_JSON.is_file():
         print("\n✅ Pipeline terminé avec succès.")
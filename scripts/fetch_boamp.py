@@ -7,12 +7,12 @@ from datetime import datetime
 from pathlib import Path
 
 from marches_geometre.collectors.boamp_client import BoampClient
-from marches_geometre.persistence.json_store import save_notices_to_json
+from marches_geometre.persistence.json_store import save_notices_to_jsonl
 from marches_geometre.services.filtering import (
     GEOMETER_KEYWORDS,
     is_notice_in_target_departments,
     is_notice_services_market,
-    is_notice_recent_and_open,
+    make_recent_open_filter,
 )
 
 logging.basicConfig(
@@ -42,23 +42,36 @@ def main() -> None:
 
     logger.info("Annonces récupérées avant filtres: %d", len(notices))
 
-    services_notices = [n for n in notices if is_notice_services_market(n)]
-    logger.info("Après filtre type de marché = Services: %d", len(services_notices))
-
-    geo_filtered = [n for n in services_notices if is_notice_in_target_departments(n)]
-    logger.info("Après filtre départements (78/92/95): %d", len(geo_filtered))
-
-    recent_open = [n for n in geo_filtered if is_notice_recent_and_open(n, days=120)]
+    # Un seul passage sur les annonces : les filtres s'enchaînent
+    # (court-circuit) et on compte au passage les survivants de chaque étape.
+    nb_services = 0
+    nb_geo = 0
+    recent_open = []
+    is_recent_open = make_recent_open_filter(days=120)
+    for n in notices:
+        if not is_notice_services_market(n):
+            continue
+        nb_services += 1
+
+        if not is_notice_in_target_departments(n):
+            continue
+        nb_geo += 1
+
+        if is_recent_open(n):
+            recent_open.append(n)
+
+    logger.info("Après filtre type de marché = Services: %d", nb_services)
+    logger.info("Après filtre départements (78/92/95): %d", nb_geo)
     logger.info(
         "Après filtre date + avis en cours: %d",
         len(recent_open),
     )
 
     today_str = datetime.now().strftime("%Y%m%d")
-    output_path = RAW_BOAMP_DIR / f"boamp_geometre_{today_str}.json"
+    output_path = RAW_BOAMP_DIR / f"boamp_geometre_{today_str}.jsonl.gz"
 
     try:
-        save_notices_to_json(output_path, recent_open)
+        save_notices_to_jsonl(output_path, recent_open)
     except OSError:
         return
 
@@ -3,11 +3,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Dict, List
+
+import orjson
 
 from marches_geometre.collectors.maximilien_client import (
     MaximilienClient,
@@ -17,16 +19,22 @@ from marches_geometre.parsers.maximilien import (
     parse_maximilien_search_results,
     MaximilienNotice,
 )
+from marches_geometre.persistence.json_store import save_jsonl
 
 
 logger = logging.getLogger(__name__)
 
+# MAXIMILIEN_DEBUG=1 pour afficher le premier avis parsé (repr + aperçu JSON)
+DEBUG_ENV_VAR = "MAXIMILIEN_DEBUG"
+
 
 def setup_logging() -> None:
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
     )
+    if os.environ.get(DEBUG_ENV_VAR):
+        logger.setLevel(logging.DEBUG)
 
 
 def ensure_directories() -> Dict[str, Path]:
@@ -37,33 +45,11 @@ def ensure_directories() -> Dict[str, Path]:
     date_str = now.strftime("%Y%m%d")
 
     html_path = base_raw / f"maximilien_geometre_idf_{date_str}.html"
-    json_path = base_raw / f"maximilien_geometre_idf_{date_str}.json"
+    json_path = base_raw / f"maximilien_geometre_idf_{date_str}.jsonl.gz"
 
     return {"html": html_path, "json": json_path}
 
 
-def maximilien_notice_to_dict(n: MaximilienNotice) -> Dict[str, Any]:
-    """Convertit un avis Maximilien en dict JSON-sérialisable."""
-    return {
-        "source": getattr(n, "source", "maximilien"),
-        "source_id": getattr(n, "source_id", None),
-        "reference": getattr(n, "reference", None),
-        "title": getattr(n, "title", None),
-        "object": getattr(n, "object", None),
-        "buyer": getattr(n, "buyer", None),
-        "procedure": getattr(n, "procedure", None),
-        "category": getattr(n, "category", None),
-        "locations": getattr(n, "locations", []),
-        "published_at": (
-            n.published_at.isoformat() if getattr(n, "published_at", None) else None
-        ),
-        "deadline": (
-            n.deadline.isoformat() if getattr(n, "deadline", None) else None
-        ),
-        "url": getattr(n, "url", None),
-    }
-
-
 def main() -> None:
     setup_logging()
     paths = ensure_directories()
@@ -88,25 +74,21 @@ def main() -> None:
     logger.info("%d avis parsés depuis Maximilien", len(notices))
 
     if not notices:
-        logger.warning("Aucun avis parsé, le JSON sera une liste vide []")
+        logger.warning("Aucun avis parsé, le JSON sera vide")
     else:
-        # Debug : afficher le premier avis parsé
-        first = notices[0]
-        logger.info("Premier avis parsé (obj): %r", first)
-        first_dict = maximilien_notice_to_dict(first)
-        logger.info("Premier avis converti en dict: %s", first_dict)
-
-    # Conversion en liste de dicts
-    data = [maximilien_notice_to_dict(n) for n in notices]
-    logger.info("Nombre d'entrées mises dans le JSON: %d", len(data))
-
-    # Debug console (optionnel)
-    if data:
+        # Debug : premier avis parsé (formaté seulement si DEBUG est actif)
+        logger.debug("Premier avis parsé (obj): %r", notices[0])
+
+    # orjson sérialise les dataclasses directement (dates en ISO 8601) :
+    # pas de liste intermédiaire de dicts, chaque avis est écrit au fil de l'eau
+    logger.info("Nombre d'entrées mises dans le JSON: %d", len(notices))
+
+    # Debug console (optionnel, MAXIMILIEN_DEBUG=1)
+    if notices and logger.isEnabledFor(logging.DEBUG):
         print("=== APERÇU DATA ===")
-        print(json.dumps(data[0], ensure_ascii=False, indent=2))
+        print(orjson.dumps(notices[0], option=orjson.OPT_INDENT_2).decode("utf-8"))
 
-    with paths["json"].open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_jsonl(paths["json"], notices)
 
     logger.info("JSON brut sauvegardé dans %s", paths["json"])
     logger.info("Terminé ✅")
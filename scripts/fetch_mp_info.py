@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Iterable, List
 
 from marches_geometre.collectors.mpinfo_form_client import (
     MpInfoFormClient,
     MpInfoSearchConfig,
 )
-from marches_geometre.persistence.json_store import save_notices_to_json
+from marches_geometre.persistence.json_store import save_notices_to_jsonl
+from marches_geometre.services.filtering import GEOMETER_KEYWORDS, strip_accents
 
 logging.basicConfig(
     level=logging.INFO,
@@ -20,21 +23,23 @@ logging.basicConfig(
 
 logger = logging.getLogger("fetch_mpinfo")
 
-# ----------------- Mots-clés géomètre -----------------
 
-GEOMETER_KEYWORDS = [
-    "géomètre",
-    "géomètre-expert",
-    "geometre",
-    "geometre-expert",
-    "topographie",
-    "topographique",
-    "bornage",
-    "plan de division",
-    "état descriptif de division",
-    "etat descriptif de division",
-    "EDD",
-]
+def _fold_keyword(keyword: str) -> str:
+    """
+    Forme de comparaison d'un mot-clé : sans accents, casse ignorée.
+    """
+    return strip_accents(keyword).casefold().strip()
+
+
+def dedupe_keywords(keywords: Iterable[str]) -> List[str]:
+    """
+    Supprime les variantes équivalentes pour la recherche AWS
+    (ex: "géomètre" / "geometre") en gardant la première rencontrée.
+    """
+    unique = {}
+    for kw in keywords:
+        unique.setdefault(_fold_keyword(kw), kw)
+    return list(unique.values())
 
 
 def main() -> None:
@@ -50,37 +55,45 @@ def main() -> None:
     all_notices = []
 
     departments = ["92", "95", "78"]
-
-    for dep in departments:
-        for kw in GEOMETER_KEYWORDS:
-            logger.info(
-                "Recherche AWS (mp-info) - dep=%s | kw='%s' | status=en_cours | nature=services",
-                dep,
-                kw,
+    # Une seule requête par mot-clé (variantes accents / casse regroupées)
+    keywords = dedupe_keywords(GEOMETER_KEYWORDS)
+    jobs = [(dep, kw) for dep in departments for kw in keywords]
+
+    def run_one(job):
+        dep, kw = job
+        logger.info(
+            "Recherche AWS (mp-info) - dep=%s | kw='%s' | status=en_cours | nature=services",
+            dep,
+            kw,
+        )
+        try:
+            notices = client.search_notices(
+                status="en_cours",
+                nature="services",
+                department_code=dep,
+                keyword=kw,
+                enrich_with_detail=True,
             )
-            try:
-                notices = client.search_notices(
-                    status="en_cours",
-                    nature="services",
-                    department_code=dep,
-                    keyword=kw,
-                    enrich_with_detail=True,
-                )
-            except RuntimeError as exc:
-                logger.error(
-                    "Erreur lors de la récupération AWS/mpinfo pour dep=%s kw='%s' : %s",
-                    dep,
-                    kw,
-                    exc,
-                )
-                continue
-
-            logger.info(
-                "→ %d annonces trouvées pour dep=%s, kw='%s'",
-                len(notices),
+        except RuntimeError as exc:
+            logger.error(
+                "Erreur lors de la récupération AWS/mpinfo pour dep=%s kw='%s' : %s",
                 dep,
                 kw,
+                exc,
             )
+            return []
+
+        logger.info(
+            "→ %d annonces trouvées pour dep=%s, kw='%s'",
+            len(notices),
+            dep,
+            kw,
+        )
+        return notices
+
+    # Les recherches sont indépendantes : on les lance en parallèle
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for notices in executor.map(run_one, jobs):
             all_notices.extend(notices)
 
     logger.info(
@@ -90,10 +103,10 @@ def main() -> None:
 
     today_str = datetime.now().strftime("%Y%m%d")
     # On garde volontairement le même nom de fichier pour ne rien casser ailleurs
-    output_path = RAW_AWS_DIR / f"aws_geometre_expires_95_{today_str}.json"
+    output_path = RAW_AWS_DIR / f"aws_geometre_expires_95_{today_str}.jsonl.gz"
 
     try:
-        save_notices_to_json(output_path, all_notices)
+        save_notices_to_jsonl(output_path, all_notices)
     except OSError as exc:
         logger.error("Erreur lors de l'écriture du JSON AWS brut : %s", exc)
         return
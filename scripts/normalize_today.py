@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from marches_geometre.models.tender import BoampNotice, AwsNotice
+from marches_geometre.persistence.json_store import iter_json_records, save_json_array
 from marches_geometre.services.normalization import (
     normalize_all,
     load_maximilien_notices,
@@ -29,14 +28,24 @@ logger = logging.getLogger("normalize")
 #                 LOADERS POUR LES SOURCES
 # ============================================================
 
+def find_raw_file(directory: Path, stem: str) -> Optional[Path]:
+    """
+    Retrouve l'archive brute du jour : .jsonl.gz (format actuel, JSON Lines)
+    ou .json.gz / .json (anciens formats, tableau JSON).
+    """
+    for suffix in (".jsonl.gz", ".json.gz", ".json"):
+        path = directory / f"{stem}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
 def load_boamp(path: Path) -> List[BoampNotice]:
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return [BoampNotice(**item) for item in data]
+    return [BoampNotice(**item) for item in iter_json_records(path)]
 
 
 def load_aws(path: Path) -> List[AwsNotice]:
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return [AwsNotice(**item) for item in data]
+    return [AwsNotice(**item) for item in iter_json_records(path)]
 
 
 # ============================================================
@@ -50,16 +59,16 @@ def main() -> None:
     # ------------------------------
     #      FICHIERS SOURCE (raw)
     # ------------------------------
-    boamp_path = Path("data/raw/boamp") / f"boamp_geometre_{today_str}.json"
-    aws_path = Path("data/raw/aws") / f"aws_geometre_expires_95_{today_str}.json"
-    maxi_path = Path("data/raw/maximilien") / f"maximilien_geometre_idf_{today_str}.json"
+    boamp_path = find_raw_file(Path("data/raw/boamp"), f"boamp_geometre_{today_str}")
+    aws_path = find_raw_file(Path("data/raw/aws"), f"aws_geometre_expires_95_{today_str}")
+    maxi_path = find_raw_file(Path("data/raw/maximilien"), f"maximilien_geometre_idf_{today_str}")
 
     # ------------------------------
     #     CHARGEMENT RAW JSON
     # ------------------------------
-    boamp_notices = load_boamp(boamp_path) if boamp_path.exists() else []
-    aws_notices = load_aws(aws_path) if aws_path.exists() else []
-    maxi_notices = load_maximilien_notices(maxi_path) if maxi_path.exists() else []
+    boamp_notices = load_boamp(boamp_path) if boamp_path else []
+    aws_notices = load_aws(aws_path) if aws_path else []
+    maxi_notices = load_maximilien_notices(maxi_path) if maxi_path else []
 
     logger.info("=== Chargement ===")
     logger.info("BOAMP       : %d notices", len(boamp_notices))
@@ -94,16 +103,10 @@ def main() -> None:
     deduped_path = PROCESSED / f"normalized_geometre_deduped_{today_str}.json"
 
     # version non dédupliquée
-    normalized_path.write_text(
-        json.dumps([asdict(n) for n in normalized], ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    save_json_array(normalized_path, normalized)
 
     # version dédupliquée
-    deduped_path.write_text(
-        json.dumps([asdict(n) for n in deduped], ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    save_json_array(deduped_path, deduped)
 
     logger.info("JSON normalisé écrit :  %s", normalized_path)
     logger.info("JSON dédoublonné écrit : %s", deduped_path)
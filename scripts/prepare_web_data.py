@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+import re
+import shutil
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 from datetime import datetime, timezone
 
+import orjson
+
 logging.basicConfig(
     level=logging.INFO,
     format="[%(asctime)s] [%(levelname)s] %(name)s - %(message)s",
@@ -17,6 +21,7 @@ logging.basicConfig(
 logger = logging.getLogger("prepare_web_data")
 
 DEDUPE_PATTERN = "normalized_geometre_deduped_*.json"
+DEDUPE_RE = re.compile(r"normalized_geometre_deduped_(\d{8})\.json")
 WEB_JSON_NAME = "normalized_geometre_latest.json"
 
 
@@ -25,10 +30,32 @@ def find_latest_deduped(processed_dir: Path) -> Optional[Path]:
     Cherche le dernier fichier normalized_geometre_deduped_YYYYMMDD.json
     dans data/processed et renvoie son Path.
     """
-    candidates = sorted(processed_dir.glob(DEDUPE_PATTERN))
-    if not candidates:
+    if not processed_dir.is_dir():
         return None
-    return candidates[-1]  # le plus récent alphabétiquement -> YYYYMMDD max
+
+    # Un seul passage sur le dossier : on garde la date YYYYMMDD la plus grande
+    best_date = -1
+    best_path: Optional[str] = None
+    with os.scandir(processed_dir) as entries:
+        for entry in entries:
+            m = DEDUPE_RE.fullmatch(entry.name)
+            if m:
+                file_date = int(m.group(1))
+                if file_date > best_date:
+                    best_date, best_path = file_date, entry.path
+
+    return Path(best_path) if best_path else None
+
+
+def _starts_with_array(f: BinaryIO) -> bool:
+    """
+    Vérification à bas coût : le fichier commence-t-il par un tableau JSON ?
+
+    Le flux est rembobiné au début après lecture.
+    """
+    head = f.read(64).lstrip()
+    f.seek(0)
+    return head[:1] == b"["
 
 
 def main() -> None:
@@ -53,26 +80,20 @@ def main() -> None:
     web_dir.mkdir(parents=True, exist_ok=True)
     dest = web_dir / WEB_JSON_NAME
 
-    # On lit le JSON dédoublonné (qui est un tableau de notices)
-    raw_content = latest.read_text(encoding="utf-8")
-    try:
-        notices = json.loads(raw_content)
-    except json.JSONDecodeError as e:
-        logger.error("JSON invalide dans %s : %s", latest, e)
-        return
-
     # Timestamp d'exécution du pipeline (UTC)
     generated_at = datetime.now(timezone.utc).isoformat()
 
-    payload = {
-        "generated_at": generated_at,
-        "notices": notices,
-    }
-
-    dest.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    # Le JSON dédoublonné (tableau de notices) est recopié tel quel dans
+    # l'enveloppe { generated_at, notices } : pas besoin de le désérialiser.
+    with latest.open("rb") as src:
+        if not _starts_with_array(src):
+            logger.error("JSON invalide dans %s : tableau de notices attendu", latest)
+            return
+
+        with dest.open("wb") as out:
+            out.write(b'{"generated_at": ' + orjson.dumps(generated_at) + b', "notices": ')
+            shutil.copyfileobj(src, out)
+            out.write(b"}\n")
 
     logger.info("Fichier web écrit : %s", dest)
     logger.info("generated_at = %s", generated_at)
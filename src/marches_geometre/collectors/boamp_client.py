@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import Any, Dict, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
-import requests
+import orjson
 from requests import Response, Session
 from requests.exceptions import RequestException, Timeout
 
+from marches_geometre.collectors.http_utils import build_session
 from marches_geometre.models.tender import BoampNotice
 
 logger = logging.getLogger(__name__)
@@ -17,17 +23,29 @@ logger = logging.getLogger(__name__)
 BOAMP_API_URL = "https://boamp-datadila.opendatasoft.com/api/records/1.0/search/"
 BOAMP_DATASET_ID = "boamp"
 
+# Cache HTTP (ETag / Last-Modified) des pages BOAMP déjà téléchargées
+BOAMP_CACHE_DIR = Path("data") / "cache" / "boamp"
+ETAG_INDEX_NAME = "boamp_etag.json"
+
+
+@lru_cache(maxsize=8)
+def _build_query_string_cached(keywords: Tuple[str, ...]) -> str:
+    unique_keywords = sorted(set(k.strip() for k in keywords if k.strip()))
+    if not unique_keywords:
+        raise ValueError("La liste de mots-clés pour la requête BOAMP est vide.")
+    return " OR ".join(unique_keywords)
+
 
 def build_query_string(keywords: List[str]) -> str:
     """
     Construit la chaîne de recherche 'q' pour Opendatasoft.
 
     Exemple : ["géomètre", "topographie"] -> "géomètre OR topographie"
+
+    Le résultat est mis en cache par liste de mots-clés (tri + dédoublonnage
+    faits une seule fois pour une même liste).
     """
-    unique_keywords = sorted(set(k.strip() for k in keywords if k.strip()))
-    if not unique_keywords:
-        raise ValueError("La liste de mots-clés pour la requête BOAMP est vide.")
-    return " OR ".join(unique_keywords)
+    return _build_query_string_cached(tuple(keywords))
 
 
 class BoampClient:
@@ -35,23 +53,131 @@ class BoampClient:
     Client minimal pour interroger l'API BOAMP via Opendatasoft.
     """
 
-    def __init__(self, base_url: str = BOAMP_API_URL, dataset_id: str = BOAMP_DATASET_ID):
+    def __init__(
+        self,
+        base_url: str = BOAMP_API_URL,
+        dataset_id: str = BOAMP_DATASET_ID,
+        max_workers: int = 8,
+        cache_dir: Optional[Path] = BOAMP_CACHE_DIR,
+    ):
         self.base_url = base_url
         self.dataset_id = dataset_id
-        self.session: Session = requests.Session()
+        # Session partagée entre les threads de pagination (GET uniquement),
+        # avec pool de connexions élargi + retry/backoff sur les erreurs transitoires
+        self.session: Session = build_session()
         # Timeout raisonnable pour éviter de bloquer le script
         self.timeout = 10
+        # Nombre max de pages demandées en parallèle
+        self.max_workers = max_workers
+
+        # Cache conditionnel : {clé requête: {"etag", "last_modified", "body"}}
+        # (cache_dir=None pour désactiver)
+        self.cache_dir = cache_dir
+        self._cache_lock = threading.Lock()
+        self._etags: Dict[str, Dict[str, str]] = self._load_etag_index()
+        # L'index n'est réécrit qu'en fin de collecte, et seulement s'il a changé
+        self._etags_dirty = False
+
+    # -----------------------
+    #  Cache HTTP (ETag)
+    # -----------------------
+
+    @staticmethod
+    def _cache_key(params: Dict[str, Any]) -> str:
+        """
+        Clé stable (entre deux exécutions) pour un jeu de paramètres.
+        """
+        raw = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha1(raw).hexdigest()
+
+    def _load_etag_index(self) -> Dict[str, Dict[str, str]]:
+        if self.cache_dir is None:
+            return {}
+
+        index_path = self.cache_dir / ETAG_INDEX_NAME
+        if not index_path.is_file():
+            return {}
+
+        try:
+            return orjson.loads(index_path.read_bytes())
+        except (OSError, ValueError) as exc:
+            logger.warning("Index ETag BOAMP illisible (%s), cache ignoré: %s", index_path, exc)
+            return {}
+
+    def _load_cached_body(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._etags.get(key)
+        if self.cache_dir is None or not entry:
+            return None
+
+        try:
+            return orjson.loads((self.cache_dir / entry["body"]).read_bytes())
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Page BOAMP en cache illisible (%s): %s", key, exc)
+            return None
+
+    def _store_in_cache(self, key: str, response: Response) -> None:
+        if self.cache_dir is None:
+            return
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        body_name = f"{key}.json"
+        with self._cache_lock:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                (self.cache_dir / body_name).write_bytes(response.content)
+                self._etags[key] = {
+                    "etag": etag or "",
+                    "last_modified": last_modified or "",
+                    "body": body_name,
+                }
+                self._etags_dirty = True
+            except OSError as exc:
+                # Le cache est un bonus : on ne casse pas la collecte pour ça
+                logger.warning("Impossible d'écrire le cache BOAMP: %s", exc)
+
+    def _save_etag_index(self) -> None:
+        """
+        Écrit l'index ETag sur disque (une fois par collecte).
+        """
+        if self.cache_dir is None or not self._etags_dirty:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / ETAG_INDEX_NAME).write_bytes(
+                orjson.dumps(self._etags, option=orjson.OPT_INDENT_2)
+            )
+            self._etags_dirty = False
+        except OSError as exc:
+            logger.warning("Impossible d'écrire l'index ETag BOAMP: %s", exc)
 
     def _request(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Envoie une requête GET à l'API avec gestion d'erreurs.
 
+        Si la page a déjà été téléchargée, on envoie If-None-Match /
+        If-Modified-Since : sur un 304, on relit la page depuis le cache.
+
         Retourne le JSON décodé, ou lève une RuntimeError explicite.
         """
+        key = self._cache_key(params)
+        entry = self._etags.get(key) or {}
+
+        headers: Dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
         try:
             response: Response = self.session.get(
                 self.base_url,
                 params=params,
+                headers=headers,
                 timeout=self.timeout,
             )
         except Timeout as exc:
@@ -61,6 +187,18 @@ class BoampClient:
             logger.error("Erreur réseau lors de l'appel à l'API BOAMP: %s", exc)
             raise RuntimeError("Erreur réseau API BOAMP") from exc
 
+        if response.status_code == 304:
+            cached = self._load_cached_body(key)
+            if cached is not None:
+                logger.info("Page BOAMP inchangée (304), lecture du cache.")
+                return cached
+
+            # Cache incohérent : on l'oublie et on redemande la page complète
+            with self._cache_lock:
+                self._etags.pop(key, None)
+                self._etags_dirty = True
+            return self._request(params)
+
         if not response.ok:
             logger.error(
                 "Erreur HTTP BOAMP: status=%s, body=%s",
@@ -70,13 +208,31 @@ class BoampClient:
             raise RuntimeError(f"Erreur HTTP BOAMP {response.status_code}")
 
         try:
-            data = response.json()
+            # Décodage direct des octets : pas de passage par response.text
+            data = orjson.loads(response.content)
         except ValueError as exc:
             logger.error("Réponse BOAMP non JSON: %s", response.text[:500])
             raise RuntimeError("Réponse BOAMP non JSON") from exc
 
+        self._store_in_cache(key, response)
         return data
 
+    def _page_params(self, query: str, start: int, rows: int) -> Dict[str, Any]:
+        """
+        Paramètres de requête pour une page de résultats.
+        """
+        return {
+            "dataset": self.dataset_id,
+            "q": query,
+            "rows": rows,
+            "start": start,
+            # ⚠️ IMPORTANT : tri décroissant (plus récents d'abord)
+            # Sur Opendatasoft v1, 'sort=champ' = décroissant, '-champ' = croissant.
+            "sort": "dateparution",
+            "timezone": "Europe/Paris",
+            "lang": "fr",
+        }
+
     def search_notices(
         self,
         keywords: List[str],
@@ -95,40 +251,37 @@ class BoampClient:
         query = build_query_string(keywords)
         logger.info("Requête BOAMP avec q=%s", query)
 
-        notices: List[BoampNotice] = []
-        start = 0
-
-        while len(notices) < max_records:
-            rows = min(rows_per_page, max_records - len(notices))
-
-            params = {
-                "dataset": self.dataset_id,
-                "q": query,
-                "rows": rows,
-                "start": start,
-                # ⚠️ IMPORTANT : tri décroissant (plus récents d'abord)
-                # Sur Opendatasoft v1, 'sort=champ' = décroissant, '-champ' = croissant.
-                "sort": "dateparution",
-                "timezone": "Europe/Paris",
-                "lang": "fr",
-            }
-
+        # Toutes les pages jusqu'à max_records sont demandées d'emblée, en
+        # parallèle sur la même Session : pas d'aller-retour préalable pour
+        # connaître nhits (les pages au-delà du dernier résultat reviennent vides).
+        params_list = []
+        for start in range(0, max_records, rows_per_page):
+            rows = min(rows_per_page, max_records - start)
             logger.info("Appel API BOAMP: start=%d, rows=%d", start, rows)
-            data = self._request(params)
+            params_list.append(self._page_params(query, start, rows))
+
+        pages: List[Dict[str, Any]] = []
+        if params_list:
+            workers = min(self.max_workers, len(params_list))
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    pages.extend(executor.map(self._request, params_list))
+            finally:
+                # pages déjà mises en cache conservées même si une autre a échoué
+                self._save_etag_index()
 
+        # Fusion des pages dans l'ordre
+        notices: List[BoampNotice] = []
+        for data in pages:
             records = data.get("records", [])
             if not records:
                 logger.info("Plus aucun enregistrement retourné par l'API BOAMP, arrêt.")
                 break
 
             for record in records:
-                notice = BoampNotice.from_record(record)
-                notices.append(notice)
-
-                if len(notices) >= max_records:
-                    break
+                notices.append(BoampNotice.from_record(record))
 
-            start += rows
+        notices = notices[:max_records]
 
         logger.info("Nombre total d'annonces récupérées (toutes dates confondues): %d", len(notices))
         return notices
@@ -0,0 +1,89 @@
+# src/marches_geometre/collectors/http_utils.py
+
+from __future__ import annotations
+
+import codecs
+import logging
+from typing import Iterable
+
+import requests
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Codes HTTP considérés comme transitoires (on retente)
+DEFAULT_STATUS_FORCELIST = (429, 502, 503, 504)
+
+
+def build_session(
+    retries: int = 5,
+    backoff_factor: float = 0.5,
+    status_forcelist: Iterable[int] = DEFAULT_STATUS_FORCELIST,
+    pool_connections: int = 16,
+    pool_maxsize: int = 16,
+) -> Session:
+    """
+    Construit une Session requests partagée par les collecteurs.
+
+    - pool de connexions urllib3 élargi (keep-alive entre les pages / requêtes)
+    - retry avec backoff exponentiel sur les erreurs réseau et les 5xx/429
+
+    Quand les retries sont épuisés sur un code HTTP, la dernière réponse est
+    renvoyée telle quelle : c'est au collecteur de la traiter (resp.ok).
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=list(status_forcelist),
+        allowed_methods=["GET", "POST"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def response_encoding(resp: Response, default: str = "utf-8") -> str:
+    """
+    Encodage à utiliser pour décoder une réponse HTML.
+
+    Sans charset dans Content-Type, requests retombe sur ISO-8859-1 (ou lance
+    une détection coûteuse sur tout le corps) : on impose alors `default`,
+    de même pour un charset inconnu (le parser lxml lèverait LookupError).
+    """
+    content_type = resp.headers.get("Content-Type", "")
+    if "charset=" in content_type.lower() and resp.encoding:
+        try:
+            codecs.lookup(resp.encoding)
+        except LookupError:
+            logger.warning("Charset inconnu %r, utilisation de %s : %s", resp.encoding, default, resp.url)
+            return default
+        return resp.encoding
+    return default
+
+
+def read_capped(resp: Response, max_bytes: int, chunk_size: int = 65536) -> bytes:
+    """
+    Lit le corps d'une réponse ouverte avec stream=True sans dépasser max_bytes.
+
+    Au-delà, la lecture s'arrête et le contenu est tronqué (une page
+    pathologique ne peut pas saturer la mémoire des workers).
+    """
+    chunks = []
+    size = 0
+    for chunk in resp.iter_content(chunk_size):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= max_bytes:
+            logger.warning("Réponse tronquée à %d octets : %s", max_bytes, resp.url)
+            break
+    return b"".join(chunks)[:max_bytes]
@@ -6,10 +6,11 @@ from datetime import date, timedelta
 from typing import Optional, Dict, Any
 
 import logging
-import requests
+import re
 from requests import Response, Session
 from requests.exceptions import RequestException, Timeout
-from bs4 import BeautifulSoup
+
+from marches_geometre.collectors.http_utils import build_session, response_encoding
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,14 @@ SEARCH_URL = (
     "?page=Entreprise.EntrepriseAdvancedSearch&searchAnnCons"
 )
 
+# Champ caché PRADO_PAGESTATE, lu directement dans les octets de la page
+# (les attributs name / value peuvent apparaître dans les deux ordres)
+_PAGESTATE_RE = re.compile(
+    rb'<input[^>]*\bname="PRADO_PAGESTATE"[^>]*\bvalue="([^"]+)"'
+    rb'|<input[^>]*\bvalue="([^"]+)"[^>]*\bname="PRADO_PAGESTATE"',
+    re.IGNORECASE,
+)
+
 
 @dataclass
 class MaximilienSearchConfig:
@@ -51,8 +60,21 @@ class MaximilienClient:
     """
 
     def __init__(self, timeout: int = 30) -> None:
-        self.session: Session = requests.Session()
+        self.session: Session = build_session()
         self.timeout = timeout
+        # En-têtes communs au GET (PRADO_PAGESTATE) et au POST de recherche
+        self.session.headers.update(
+            {
+                "User-Agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/131.0 Safari/537.36"
+                ),
+                "Referer": SEARCH_URL,
+            }
+        )
+        # PRADO_PAGESTATE réutilisé d'une recherche à l'autre (invalidé si le POST échoue)
+        self._page_state: Optional[str] = None
 
     # -----------------------
     #  Helpers internes HTTP
@@ -82,7 +104,7 @@ class MaximilienClient:
 
         return resp
 
-    def _post(self, url: str, data: Dict[str, Any], headers: Dict[str, str]) -> Response:
+    def _post(self, url: str, data: Dict[str, Any]) -> Response:
         """
         Wrapper POST avec gestion des erreurs réseau / timeout.
         """
@@ -90,7 +112,6 @@ class MaximilienClient:
             resp = self.session.post(
                 url,
                 data=data,
-                headers=headers,
                 timeout=self.timeout,
             )
         except Timeout as exc:
@@ -118,23 +139,28 @@ class MaximilienClient:
     def _get_page_state(self) -> str:
         """
         Fait un GET sur la page de recherche avancée et extrait PRADO_PAGESTATE.
+        La valeur est mise en cache sur le client (pas de nouveau GET tant
+        qu'elle n'est pas invalidée).
 
         Retourne :
             la valeur du champ caché PRADO_PAGESTATE.
 
         Lève une RuntimeError si le champ n'est pas trouvé.
         """
+        if self._page_state is not None:
+            return self._page_state
+
         logger.info("Récupération de PRADO_PAGESTATE sur la page de recherche Maximilien...")
         resp = self._get(SEARCH_URL)
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        hidden = soup.find("input", {"name": "PRADO_PAGESTATE"})
-        if not hidden or not hidden.get("value"):
+        m = _PAGESTATE_RE.search(resp.content)
+        if not m:
             logger.error("Impossible de trouver PRADO_PAGESTATE dans la page HTML Maximilien.")
             raise RuntimeError("Impossible de trouver PRADO_PAGESTATE dans la page de recherche Maximilien")
 
-        page_state = hidden["value"]
+        page_state = (m.group(1) or m.group(2)).decode("utf-8")
         logger.debug("PRADO_PAGESTATE length=%d", len(page_state))
+        self._page_state = page_state
         return page_state
 
     @staticmethod
@@ -207,17 +233,16 @@ class MaximilienClient:
             "PRADO_POSTBACK_TARGET": "ctl0$CONTENU_PAGE$AdvancedSearch$lancerRecherche",
         }
 
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/131.0 Safari/537.36"
-            ),
-            "Referer": SEARCH_URL,
-        }
-
         logger.info("Envoi du POST de recherche Maximilien...")
-        resp = self._post(SEARCH_URL, data=payload, headers=headers)
+        try:
+            resp = self._post(SEARCH_URL, data=payload)
+        except RuntimeError:
+            # PRADO_PAGESTATE en cache peut être périmé : on en redemande un, une fois
+            logger.warning("POST Maximilien en échec, nouvel essai avec un PRADO_PAGESTATE frais.")
+            self._page_state = None
+            payload["PRADO_PAGESTATE"] = self._get_page_state()
+            resp = self._post(SEARCH_URL, data=payload)
+        resp.encoding = response_encoding(resp)
         logger.info("HTML résultats Maximilien récupéré (%d caractères)", len(resp.text))
 
         return resp.text
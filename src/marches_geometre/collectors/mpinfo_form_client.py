@@ -3,15 +3,18 @@ from __future__ import annotations
 
 import logging
 import re
-import time
+from html import unescape
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Literal, Optional
 
-import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from requests import Session, Response
 from requests.exceptions import RequestException, Timeout
 
+from marches_geometre.collectors.http_utils import build_session, read_capped, response_encoding
 from marches_geometre.models.tender import AwsNotice
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,83 @@ logger = logging.getLogger(__name__)
 AnnonceStatus = Literal["en_cours", "expires", "attributions", "donnees_essentielles"]
 NatureType = Literal["toutes", "travaux", "services", "fournitures"]
 
+# Codes attendus par le formulaire de recherche AWS
+_STATUS_MAP: Dict[str, str] = {
+    "en_cours": "EC",
+    "expires": "A",
+    "attributions": "AAA",
+    "donnees_essentielles": "DE",
+}
+
+_NATURE_MAP: Dict[str, str] = {
+    "toutes": "X",
+    "travaux": "T",
+    "services": "S",
+    "fournitures": "F",
+}
+
+# Champs du formulaire, dans l'ordre du site ; IDE / IDN / IDR / txtLibre
+# sont renseignés à chaque recherche
+_FORM_TEMPLATE: Dict[str, str] = {
+    "IDE": "",
+    "IDN": "",
+    "IDP": "X",
+    "IDR": "",
+    "listeCPV": "",
+    "txtLibre": "",
+    "txtLibreLieuExec": "",
+    "txtAcheteurNom": "",
+    "txtAcheteurSiret": "",
+    "txtTitulaireNom": "",
+    "txtTitulaireSiret": "",
+    "txtLibreAcheteur": "",
+    "txtLibreVille": "",
+    "txtLibreRef": "",
+    "txtLibreObjet": "",
+    "dateParution": "",
+    "dateExpiration": "",
+    "annee": "X",
+    "Rechercher": "Rechercher",
+}
+
+
+def _has_class(name: str) -> str:
+    """
+    Prédicat XPath équivalent à class_="name" de BeautifulSoup
+    (l'attribut class peut contenir plusieurs classes).
+    """
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# Expressions régulières compilées une seule fois (appelées pour chaque avis)
+_PUB_RE = re.compile(r"Publié le\s+(\d{2}/\d{2}/\d{2})")
+_DATE_RE = re.compile(r"(\d{2}/\d{2}/\d{2})")
+_TIME_RE = re.compile(r"(\d{2}h\d{2})")
+_BUYER_RE = re.compile(r"^(.*)\((\d+)\)\s*$")
+_REF_RE = re.compile(r"\[réf\.\s*(.+?)\]", re.IGNORECASE)
+_BUDGET_RE = re.compile(r"Montant HT\s*:?\s*([\d\s\u00A0\.,]+)\s*€", re.IGNORECASE)
+# Pré-filtre sur le HTML décodé des pages de détail
+_MONTANT_RE = re.compile(r"montant", re.IGNORECASE)
+
+# XPath compilées une seule fois, réutilisées pour chaque avis
+_XP_SERVICES_TAB = etree.XPath('//div[@id="2"]')
+_XP_ENTITIES = etree.XPath('.//div[@id="entity"]')
+_XP_DATE_ROW = etree.XPath(f".//div[{_has_class('affiche_date_avis')}]")
+_XP_H2 = etree.XPath(f".//h2[{_has_class('h2-avis')}]")
+_XP_TITRE_BOX = etree.XPath('.//div[@id="titre_box"]')
+_XP_REF_ACHETEUR = etree.XPath(f".//div[{_has_class('ref-acheteur')}]")
+_XP_P = etree.XPath(".//p")
+_XP_CONSULT_HREF = etree.XPath('.//a[@href][contains(., "Consulter")]/@href')
+# Textes visibles (comme stripped_strings : ni <script> ni <style>)
+_XP_VISIBLE_TEXT = etree.XPath(".//text()[not(ancestor::script or ancestor::style)]")
+
+
+def _joined_text(el: etree._Element) -> str:
+    """
+    Équivalent lxml de " ".join(tag.stripped_strings).
+    """
+    return " ".join(s.strip() for s in _XP_VISIBLE_TEXT(el) if s.strip())
+
 
 # =====================================================
 #                   CONFIG
@@ -32,7 +112,11 @@ class MpInfoSearchConfig:
 
     search_url: str = "https://www.marches-publics.info/Annonces/lister"
     timeout: int = 15
-    retries: int = 2                   # nombre de retries sur timeout
+    retries: int = 2                   # retries réseau / 5xx (adapter de la Session)
+    detail_workers: int = 8            # pages de détail récupérées en parallèle
+    max_in_flight: int = 16            # requêtes HTTP simultanées max (tous threads confondus)
+    store_raw_html: bool = False       # conserver le bloc HTML de chaque avis (debug)
+    max_detail_bytes: int = 2 * 1024 * 1024  # taille max lue par page de détail
 
 
 # =====================================================
@@ -49,7 +133,12 @@ class MpInfoFormClient:
 
     def __init__(self, config: Optional[MpInfoSearchConfig] = None):
         self.config = config or MpInfoSearchConfig()
-        self.session: Session = requests.Session()
+        # Pool élargi : recherches et pages de détail partent en parallèle
+        self.session: Session = build_session(
+            retries=self.config.retries,
+            status_forcelist=(500, 502, 503, 504),
+            pool_maxsize=32,
+        )
 
         self.session.headers.update(
             {
@@ -61,72 +150,61 @@ class MpInfoFormClient:
             }
         )
 
+        # Le client peut être partagé entre plusieurs threads (recherches et
+        # pages de détail en parallèle) : on borne le nombre total de requêtes
+        # en vol pour rester poli avec le serveur.
+        self._in_flight = threading.BoundedSemaphore(self.config.max_in_flight)
+
     # ================================================
     #             HELPERS HTTP ROBUSTES
     # ================================================
 
     def _post(self, url: str, data: Dict[str, Any]) -> Response:
         """
-        Enveloppe POST avec retry + logs + exceptions propres.
+        Enveloppe POST avec logs + exceptions propres.
+
+        Les retries (erreurs réseau, 5xx) sont gérés par l'adapter de la Session.
         """
-        for attempt in range(self.config.retries + 1):
-            try:
+        try:
+            with self._in_flight:
                 resp = self.session.post(
                     url,
                     data=data,
                     timeout=self.config.timeout,
                 )
-                if resp.ok:
-                    return resp
+        except (Timeout, RequestException) as exc:
+            logger.warning("Erreur réseau POST %s : %s", url, exc)
+            raise RuntimeError(f"Échec POST vers {url} après plusieurs tentatives.") from exc
 
-                logger.warning(
-                    "HTTP %s sur %s (tentative %d/%d)",
-                    resp.status_code,
-                    url,
-                    attempt + 1,
-                    self.config.retries + 1,
-                )
-
-            except (Timeout, RequestException) as exc:
-                logger.warning(
-                    "Erreur réseau POST %s (tentative %d/%d): %s",
-                    url,
-                    attempt + 1,
-                    self.config.retries + 1,
-                    exc,
-                )
-                time.sleep(1.0)
+        if not resp.ok:
+            logger.warning("HTTP %s sur %s", resp.status_code, url)
+            raise RuntimeError(f"Échec POST vers {url} après plusieurs tentatives.")
 
-        raise RuntimeError(f"Échec POST vers {url} après plusieurs tentatives.")
+        return resp
 
-    def _get(self, url: str) -> Response:
+    def _get_capped(self, url: str, max_bytes: int) -> tuple[bytes, str]:
         """
-        Enveloppe GET avec retry.
-        """
-        for attempt in range(self.config.retries + 1):
-            try:
-                resp = self.session.get(url, timeout=self.config.timeout)
-                if resp.ok:
-                    return resp
-
-                logger.warning(
-                    "HTTP %s sur GET %s (tentative %d/%d)",
-                    resp.status_code,
-                    url,
-                    attempt + 1,
-                    self.config.retries + 1,
-                )
-            except (Timeout, RequestException) as exc:
-                logger.warning(
-                    "Erreur réseau GET %s (tentative %d/%d): %s",
-                    url,
-                    attempt + 1,
-                    self.config.retries + 1,
-                    exc,
-                )
-                time.sleep(1.0)
+        GET en streaming, corps lu dans la limite de max_bytes
+        (retries gérés par l'adapter de la Session).
+
+        Le créneau _in_flight est tenu jusqu'à la fin de la lecture du corps,
+        et une coupure en cours de lecture est traduite en RuntimeError comme
+        les autres erreurs réseau.
 
-        raise RuntimeError(f"Échec GET {url} après plusieurs tentatives.")
+        Retourne (contenu, encodage).
+        """
+        try:
+            with self._in_flight:
+                with self.session.get(url, timeout=self.config.timeout, stream=True) as resp:
+                    if not resp.ok:
+                        logger.warning("HTTP %s sur GET %s", resp.status_code, url)
+                        raise RuntimeError(f"Échec GET {url} après plusieurs tentatives.")
+                    content = read_capped(resp, max_bytes)
+        except (Timeout, RequestException) as exc:
+            logger.warning("Erreur réseau GET %s : %s", url, exc)
+            raise RuntimeError(f"Échec GET {url} après plusieurs tentatives.") from exc
+
+        return content, response_encoding(resp)
 
     # ================================================
     #         BUILD FORM DATA POUR LE POST
@@ -140,61 +218,31 @@ class MpInfoFormClient:
         keyword: str,
     ) -> Dict[str, Any]:
 
-        status_map = {
-            "en_cours": "EC",
-            "expires": "A",
-            "attributions": "AAA",
-            "donnees_essentielles": "DE",
-        }
-
-        nature_map = {
-            "toutes": "X",
-            "travaux": "T",
-            "services": "S",
-            "fournitures": "F",
-        }
-
-        if status not in status_map:
+        if status not in _STATUS_MAP:
             raise ValueError(f"Status invalide: {status}")
 
-        if nature not in nature_map:
+        if nature not in _NATURE_MAP:
             raise ValueError(f"Nature invalide: {nature}")
 
-        form = {
-            "IDE": status_map[status],
-            "IDN": nature_map[nature],
-            "IDP": "X",
+        return {
+            **_FORM_TEMPLATE,
+            "IDE": _STATUS_MAP[status],
+            "IDN": _NATURE_MAP[nature],
             "IDR": department_code,
-            "listeCPV": "",
             "txtLibre": keyword or "",
-            "txtLibreLieuExec": "",
-            "txtAcheteurNom": "",
-            "txtAcheteurSiret": "",
-            "txtTitulaireNom": "",
-            "txtTitulaireSiret": "",
-            "txtLibreAcheteur": "",
-            "txtLibreVille": "",
-            "txtLibreRef": "",
-            "txtLibreObjet": "",
-            "dateParution": "",
-            "dateExpiration": "",
-            "annee": "X",
-            "Rechercher": "Rechercher",
         }
 
-        return form
-
     # ================================================
     #                MAIN SEARCH
     # ================================================
 
-    def search_html(
+    def _search_response(
         self,
         status: AnnonceStatus,
         nature: NatureType,
         department_code: str,
         keyword: str,
-    ) -> str:
+    ) -> Response:
 
         form_data = self._build_form_data(
             status=status,
@@ -214,7 +262,23 @@ class MpInfoFormClient:
         logger.debug("Payload envoyé : %s", form_data)
 
         resp = self._post(self.config.search_url, form_data)
-        logger.info("HTML résultats AWS récupéré (%d caractères)", len(resp.text))
+        logger.info("HTML résultats AWS récupéré (%d octets)", len(resp.content))
+        return resp
+
+    def search_html(
+        self,
+        status: AnnonceStatus,
+        nature: NatureType,
+        department_code: str,
+        keyword: str,
+    ) -> str:
+        resp = self._search_response(
+            status=status,
+            nature=nature,
+            department_code=department_code,
+            keyword=keyword,
+        )
+        resp.encoding = response_encoding(resp)
         return resp.text
 
     # ================================================
@@ -222,21 +286,41 @@ class MpInfoFormClient:
     # ================================================
 
     @staticmethod
-    def _parse_notices_from_html(html: str) -> List[AwsNotice]:
-        soup = BeautifulSoup(html, "html.parser")
+    def _parse_notices_from_html(
+        html: bytes | str,
+        store_raw_html: bool = False,
+        encoding: str = "utf-8",
+    ) -> List[AwsNotice]:
+        if not html or not html.strip():
+            logger.warning("Page de résultats AWS vide.")
+            return []
+
+        # lxml refuse une str qui commence par <?xml ... encoding="..."?> :
+        # on lui passe toujours des octets avec l'encodage explicite
+        if isinstance(html, str):
+            html, encoding = html.encode("utf-8"), "utf-8"
+        parser = lxml.html.HTMLParser(encoding=encoding)
+        root = lxml.html.document_fromstring(html, parser=parser)
 
         # onglet SERVICES (id=2)
-        services_tab = soup.find("div", {"id": "2"}) or soup
+        tabs = _XP_SERVICES_TAB(root)
+        services_tab = tabs[0] if tabs else root
 
         notices: List[AwsNotice] = []
 
-        entities = services_tab.find_all("div", id="entity")
+        entities = _XP_ENTITIES(services_tab)
         if not entities:
             logger.warning("Aucune balise <div id='entity'> trouvée.")
             return []
 
         for entity in entities:
-            raw_html = str(entity)
+            # Re-sérialiser chaque bloc coûte cher et garde beaucoup de texte
+            # en mémoire : seulement sur demande
+            raw_html = (
+                lxml.html.tostring(entity, encoding="unicode", with_tail=False)
+                if store_raw_html
+                else ""
+            )
 
             # ------------------------------------
             #   Dates
@@ -245,12 +329,12 @@ class MpInfoFormClient:
             deadline_date = None
             deadline_time = None
 
-            date_row = entity.find("div", class_="affiche_date_avis")
-            if date_row:
-                text = " ".join(date_row.stripped_strings)
-                m_pub = re.search(r"Publié le\s+(\d{2}/\d{2}/\d{2})", text)
-                m_dead = re.search(r"(\d{2}/\d{2}/\d{2})", text)
-                m_time = re.search(r"(\d{2}h\d{2})", text)
+            date_rows = _XP_DATE_ROW(entity)
+            if date_rows:
+                text = _joined_text(date_rows[0])
+                m_pub = _PUB_RE.search(text)
+                m_dead = _DATE_RE.search(text)
+                m_time = _TIME_RE.search(text)
 
                 if m_pub:
                     pub_date = m_pub.group(1)
@@ -265,10 +349,10 @@ class MpInfoFormClient:
             buyer_name = None
             buyer_code = None
 
-            h2 = entity.find("h2", class_="h2-avis")
-            if h2:
-                line = " ".join(h2.stripped_strings)
-                mm = re.match(r"^(.*)\((\d+)\)\s*$", line)
+            h2s = _XP_H2(entity)
+            if h2s:
+                line = _joined_text(h2s[0])
+                mm = _BUYER_RE.match(line)
                 if mm:
                     buyer_name = mm.group(1).strip()
                     buyer_code = mm.group(2)
@@ -282,36 +366,39 @@ class MpInfoFormClient:
             object_text = None
             lots_info = None
 
-            titre_box = entity.find("div", id="titre_box")
-            if titre_box:
+            titre_boxes = _XP_TITRE_BOX(entity)
+            if titre_boxes:
+                titre_box = titre_boxes[0]
+
                 # référence
-                ref_div = titre_box.find("div", class_="ref-acheteur")
-                if ref_div:
-                    txt = " ".join(ref_div.stripped_strings)
-                    mm = re.search(r"\[réf\.\s*(.+?)\]", txt, flags=re.IGNORECASE)
+                ref_divs = _XP_REF_ACHETEUR(titre_box)
+                ref_div = ref_divs[0] if ref_divs else None
+                if ref_div is not None:
+                    txt = _joined_text(ref_div)
+                    mm = _REF_RE.search(txt)
                     reference = mm.group(1).strip() if mm else txt.strip()
 
                 # lots
-                p_lots = titre_box.find("p")
+                p_lots = _XP_P(titre_box)
                 if p_lots:
-                    lots_info = " ".join(p_lots.stripped_strings)
+                    lots_info = _joined_text(p_lots[0])
 
-                # objet
-                full = " ".join(titre_box.stripped_strings)
-                if ref_div:
-                    full = full.replace(" ".join(ref_div.stripped_strings), "")
-                if lots_info:
-                    full = full.replace(lots_info, "")
+                # objet : ce qui reste une fois la référence et les lots retirés
+                # (drop_tree conserve le texte qui suit l'élément supprimé)
+                if ref_div is not None:
+                    ref_div.drop_tree()
+                if p_lots:
+                    p_lots[0].drop_tree()
 
-                object_text = full.strip() or None
+                object_text = " ".join(" ".join(titre_box.itertext()).split()) or None
 
             # ------------------------------------
             #   URL détail
             # ------------------------------------
             detail_url = None
-            link = entity.find("a", href=True, string=lambda s: s and "Consulter" in s)
-            if link:
-                href = link["href"]
+            hrefs = _XP_CONSULT_HREF(entity)
+            if hrefs:
+                href = str(hrefs[0])
                 if href.startswith("http"):
                     detail_url = href
                 else:
@@ -341,10 +428,24 @@ class MpInfoFormClient:
     #        SCRAPPING PAGES DE DÉTAIL (BUDGET)
     # ================================================
 
-    def _extract_budget_from_detail_html(self, html: str) -> tuple[Optional[float], Optional[str]]:
-        text = " ".join(BeautifulSoup(html, "html.parser").stripped_strings)
+    def _extract_budget_from_detail_html(
+        self,
+        html: bytes,
+        encoding: str = "utf-8",
+    ) -> tuple[Optional[float], Optional[str]]:
+        # La plupart des pages n'ont pas de montant : test sur le HTML décodé
+        # (entités comprises, ex. "Mont&#97;nt") avant de construire l'arbre
+        decoded = html.decode(encoding, errors="replace")
+        if not _MONTANT_RE.search(decoded) and not (
+            "&" in decoded and _MONTANT_RE.search(unescape(decoded))
+        ):
+            return None, None
+
+        # Octets bruts décodés par lxml avec l'encodage de la réponse
+        parser = lxml.html.HTMLParser(encoding=encoding)
+        text = _joined_text(lxml.html.document_fromstring(html, parser=parser))
 
-        m = re.search(r"Montant HT\s*:?\s*([\d\s\u00A0\.,]+)\s*€", text, flags=re.IGNORECASE)
+        m = _BUDGET_RE.search(text)
         if not m:
             return None, None
 
@@ -358,21 +459,29 @@ class MpInfoFormClient:
 
         return value, raw
 
-    def _enrich_notices_with_budget(self, notices: List[AwsNotice], sleep_seconds: float = 0.5) -> None:
-        for n in notices:
-            if not n.detail_url:
-                continue
-
-            try:
-                resp = self._get(n.detail_url)
-            except RuntimeError:
-                continue
-
-            budget_val, budget_raw = self._extract_budget_from_detail_html(resp.text)
-            n.estimated_budget = budget_val
-            n.estimated_budget_raw = budget_raw
-
-            time.sleep(sleep_seconds)
+    def _fetch_detail(self, url: str) -> Optional[tuple[bytes, str]]:
+        try:
+            return self._get_capped(url, self.config.max_detail_bytes)
+        except RuntimeError:
+            return None
+
+    def _enrich_notices_with_budget(self, notices: List[AwsNotice]) -> None:
+        # Pages de détail indépendantes : on les récupère en parallèle
+        # (la concurrence réelle est bornée par _in_flight, plus de sleep)
+        targets = [n for n in notices if n.detail_url]
+        if not targets:
+            return
+
+        workers = min(self.config.detail_workers, len(targets))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pages = executor.map(self._fetch_detail, [n.detail_url for n in targets])
+            for n, page in zip(targets, pages):
+                if page is None:
+                    continue
+
+                budget_val, budget_raw = self._extract_budget_from_detail_html(*page)
+                n.estimated_budget = budget_val
+                n.estimated_budget_raw = budget_raw
 
     # ================================================
     #                   API PUBLIQUE
@@ -387,14 +496,18 @@ class MpInfoFormClient:
         enrich_with_detail: bool = False,
     ) -> List[AwsNotice]:
 
-        html = self.search_html(
+        resp = self._search_response(
             status=status,
             nature=nature,
             department_code=department_code,
             keyword=keyword,
         )
 
-        notices = self._parse_notices_from_html(html)
+        notices = self._parse_notices_from_html(
+            resp.content,
+            self.config.store_raw_html,
+            encoding=response_encoding(resp),
+        )
 
         if enrich_with_detail and notices:
             self._enrich_notices_with_budget(notices)
@@ -9,7 +9,7 @@ from typing import Literal, Optional, Dict, Any
 SourceType = Literal["boamp", "aws"]
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedNotice:
     """
     Représentation commune d'un avis de marché (BOAMP, AWS...).
@@ -3,14 +3,39 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 # =======================
 # BOAMP
 # =======================
 
-@dataclass
+# Champ BoampNotice -> clés possibles dans "fields", par ordre de priorité
+# (les noms varient selon les jeux de données / versions de l'API)
+_BOAMP_FIELD_KEYS: Dict[str, Tuple[str, ...]] = {
+    "title": ("objet", "intitule"),
+    "reference": ("numeroad", "idweb"),
+    "buyer_name": ("nom_acheteur", "nomacheteur"),
+    "department": ("code_departement", "departement"),
+    "postal_code": ("code_postal", "codepostal"),
+    "url": ("lien", "url", "url_avis"),
+}
+
+
+def _first(fields: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """
+    Équivalent de fields.get(k1) or fields.get(k2) or ... :
+    première valeur non vide, sinon la dernière valeur lue.
+    """
+    value = None
+    for key in keys:
+        value = fields.get(key)
+        if value:
+            return value
+    return value
+
+
+@dataclass(slots=True)
 class BoampNotice:
     """
     Représente une annonce BOAMP normalisée pour notre usage.
@@ -34,17 +59,18 @@ class BoampNotice:
     @classmethod
     def from_record(cls, record: Dict[str, Any]) -> "BoampNotice":
         fields = record.get("fields", {})
+        keys = _BOAMP_FIELD_KEYS
 
         return cls(
             record_id=record.get("recordid", ""),
-            title=fields.get("objet") or fields.get("intitule") or None,
-            reference=fields.get("numeroad") or fields.get("idweb") or None,
+            title=_first(fields, keys["title"]) or None,
+            reference=_first(fields, keys["reference"]) or None,
             publication_date=fields.get("dateparution"),
-            buyer_name=fields.get("nom_acheteur") or fields.get("nomacheteur"),
-            department=str(fields.get("code_departement") or fields.get("departement") or ""),
+            buyer_name=_first(fields, keys["buyer_name"]),
+            department=str(_first(fields, keys["department"]) or ""),
             city=fields.get("ville"),
-            postal_code=fields.get("code_postal") or fields.get("codepostal"),
-            url=fields.get("lien") or fields.get("url") or fields.get("url_avis"),
+            postal_code=_first(fields, keys["postal_code"]),
+            url=_first(fields, keys["url"]),
             application_deadline=fields.get("datelimitereponse"),
             raw_fields=fields,
         )
@@ -54,7 +80,7 @@ class BoampNotice:
 # Marches-publics.info (AWS)
 # =======================
 
-@dataclass
+@dataclass(slots=True)
 class AwsNotice:
     """
     Représente une annonce issue d'une page de résultats
@@ -74,7 +100,7 @@ class AwsNotice:
     object: Optional[str]            # description du marché
     lots_info: Optional[str]         # ex: "[Marché alloti : 2 lots]"
     detail_url: Optional[str]        # URL complète "https://..."
-    raw_html: str                    # bloc HTML brut pour debug
+    raw_html: str = ""               # bloc HTML brut (debug, cf. store_raw_html)
 
     estimated_budget: Optional[float] = None       # ex: 300000.0
     estimated_budget_raw: Optional[str] = None
@@ -2,17 +2,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+import io
 import re
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 
 # ==========================
 #   Utilitaires de dates
 # ==========================
 
-FRENCH_MONTHS = {
+_FRENCH_MONTHS_BASE = {
     # On couvre un max de variantes possibles
     "janv.": 1,
     "janvier": 1,
@@ -41,6 +42,19 @@ FRENCH_MONTHS = {
     "decembre": 12,
 }
 
+# Chaque abréviation est présente avec et sans point final : une seule
+# recherche suffit après normalisation (cf. _parse_french_date)
+FRENCH_MONTHS = {
+    **{k.rstrip("."): v for k, v in _FRENCH_MONTHS_BASE.items()},
+    **_FRENCH_MONTHS_BASE,
+}
+
+
+# "Objet :" / "Organisme :" dans la colonne intitulé
+_LABEL_RE = re.compile(r"(Objet|Organisme) :")
+_HHMM_RE = re.compile(r"(\d{1,2}):(\d{2})")
+_CONSULTATION_ID_RE = re.compile(r"/consultation/(\d+)")
+
 
 def _parse_french_date(day_str: str, month_str: str, year_str: str) -> Optional[date]:
     """
@@ -50,27 +64,13 @@ def _parse_french_date(day_str: str, month_str: str, year_str: str) -> Optional[
         "25", "Fév.", "2025" -> date(2025, 2, 25)
     """
     day_str = (day_str or "").strip()
-    month_str = (month_str or "").strip().lower()
+    month_str = (month_str or "").strip().lower().rstrip(".")
     year_str = (year_str or "").strip()
 
     if not day_str or not month_str or not year_str:
         return None
 
-    # On nettoie un peu le mois
-    month_str = month_str.replace("é", "é").replace("É", "é")
-    key = month_str
-
-    # On essaye avec/sans point
-    if key not in FRENCH_MONTHS:
-        key = key.rstrip(".")
-        if key in FRENCH_MONTHS:
-            month = FRENCH_MONTHS[key]
-        else:
-            key_dot = key + "."
-            month = FRENCH_MONTHS.get(key_dot)
-    else:
-        month = FRENCH_MONTHS[key]
-
+    month = FRENCH_MONTHS.get(month_str)
     if not month:
         return None
 
@@ -93,22 +93,16 @@ def _parse_french_datetime(
     if not d:
         return None
 
-    time_str = (time_str or "").strip()
-    if not time_str:
-        # Pas d'heure -> minuit
-        return datetime(d.year, d.month, d.day)
+    # Pas d'heure (ou heure illisible / hors bornes) -> minuit
+    hour = minute = 0
+    m = _HHMM_RE.match((time_str or "").strip())
+    if m:
+        hour = int(m.group(1))
+        minute = int(m.group(2))
+        if hour > 23 or minute > 59:
+            hour = minute = 0
 
-    m = re.match(r"(\d{1,2}):(\d{2})", time_str)
-    if not m:
-        return datetime(d.year, d.month, d.day)
-
-    hour = int(m.group(1))
-    minute = int(m.group(2))
-
-    try:
-        return datetime(d.year, d.month, d.day, hour, minute)
-    except ValueError:
-        return datetime(d.year, d.month, d.day)
+    return datetime(d.year, d.month, d.day, hour, minute)
 
 
 def _extract_source_id_from_url(url: str) -> Optional[str]:
@@ -117,7 +111,7 @@ def _extract_source_id_from_url(url: str) -> Optional[str]:
         /entreprise/consultation/903785?orgAcronyme=a0z
         https://marches.maximilien.fr/entreprise/consultation/903785?orgAcronyme=a0z
     """
-    m = re.search(r"/consultation/(\d+)", url)
+    m = _CONSULTATION_ID_RE.search(url)
     if m:
         return m.group(1)
     return None
@@ -127,7 +121,7 @@ def _extract_source_id_from_url(url: str) -> Optional[str]:
 #   Modèle de notice
 # ==========================
 
-@dataclass
+@dataclass(slots=True)
 class MaximilienNotice:
     source: str               # "maximilien"
     source_id: str            # ID numérique dans l'URL
@@ -143,6 +137,144 @@ class MaximilienNotice:
     url: str                  # URL relative ou absolue vers la consultation
 
 
+# ==========================
+#   Helpers HTML (lxml)
+# ==========================
+
+def _get_text(el: etree._Element, sep: str = "", strip: bool = False) -> str:
+    """
+    Équivalent lxml de Tag.get_text(sep, strip=...) de BeautifulSoup.
+    """
+    if strip:
+        return sep.join(s.strip() for s in el.itertext() if s.strip())
+    return sep.join(el.itertext())
+
+
+def _iter_rows(html: str) -> Iterator[etree._Element]:
+    """
+    Parse la page en flux (iterparse) et renvoie chaque
+    <div class="item_consultation list-group-item"> dès qu'il est complet.
+
+    Une fois la ligne traitée par l'appelant, son sous-arbre et les noeuds
+    qui la précèdent sont libérés : l'arbre ne grossit pas avec la page.
+    """
+    events = etree.iterparse(
+        io.BytesIO(html.encode("utf-8")),
+        events=("end",),
+        tag="div",
+        html=True,
+        encoding="utf-8",
+        # Commentaires et instructions de traitement ne sont jamais lus :
+        # inutile de les matérialiser dans l'arbre
+        remove_comments=True,
+        remove_pis=True,
+    )
+    for _, el in events:
+        classes = (el.get("class") or "").split()
+        if "item_consultation" not in classes or "list-group-item" not in classes:
+            continue
+
+        yield el
+
+        el.clear(keep_tail=True)
+        parent = el.getparent()
+        while el.getprevious() is not None:
+            del parent[0]
+
+_DATE_PARTS = ("day", "month", "year")
+
+# Seuls les div dont le texte contient un des libellés valent la peine d'être
+# reconstruits (le mot seul suffit : le texte joint par espaces ne peut
+# contenir "Objet :" que si le texte brut contient "Objet")
+_XP_LABEL_DIVS = etree.XPath('.//div[contains(., "Objet") or contains(., "Organisme")]')
+
+
+def _scan_row(row: etree._Element) -> Dict[str, Any]:
+    """
+    Parcourt une seule fois le sous-arbre d'une consultation et relève les
+    noeuds utiles, en reproduisant les sélecteurs CSS d'origine
+    (".cons_ref .cons_procedure span", ".cons_dateEnd .date .day span"...).
+
+    `ctx` compte les classes portées par les ancêtres du noeud courant ; les
+    pseudo-classes "@..." marquent le premier bloc retenu (select_one) pour
+    la colonne d'actions, la ligne objet et le 2e div.small.
+
+    Clés renvoyées : procedure, category, pub_<part>, pub_min_<part>,
+    dl_<part>, dl_cl_<part>, time, time_cl, lieux, cons_intitule (éléments),
+    url (str), smalls (liste d'éléments), title_span.
+    """
+    found: Dict[str, Any] = {"smalls": []}
+    ctx: Dict[str, int] = {}
+    stack: List[List[str]] = []
+
+    for event, el in etree.iterwalk(row, events=("start", "end")):
+        if event == "end":
+            for c in stack.pop():
+                ctx[c] -= 1
+            continue
+
+        classes = (el.get("class") or "").split()
+        marks = list(classes)
+        tag = el.tag
+
+        if tag == "span":
+            if ctx.get("cons_ref"):
+                if ctx.get("cons_procedure"):
+                    found.setdefault("procedure", el)
+                if ctx.get("cons_categorie"):
+                    found.setdefault("category", el)
+                for part in _DATE_PARTS:
+                    if ctx.get(part):
+                        if ctx.get("date-min"):
+                            found.setdefault(f"pub_min_{part}", el)
+                        if ctx.get("date"):
+                            found.setdefault(f"pub_{part}", el)
+            if ctx.get("cons_dateEnd") and ctx.get("date"):
+                for part in _DATE_PARTS:
+                    if ctx.get(part):
+                        if ctx.get("cloture-line"):
+                            found.setdefault(f"dl_cl_{part}", el)
+                        found.setdefault(f"dl_{part}", el)
+            if ctx.get("@small2"):
+                found.setdefault("title_span", el)
+
+        elif tag == "label":
+            if ctx.get("cons_dateEnd") and ctx.get("time"):
+                if ctx.get("cloture-line"):
+                    found.setdefault("time_cl", el)
+                found.setdefault("time", el)
+
+        elif tag == "a":
+            if ctx.get("@actions") and "url" not in found:
+                href = el.get("href", "")
+                if "/entreprise/consultation/" in href:
+                    found["url"] = href
+
+        elif tag == "div":
+            if "col_actions" in classes and "actions" not in found:
+                found["actions"] = el
+                marks.append("@actions")
+            if ctx.get("@objet_line") and "small" in classes:
+                found["smalls"].append(el)
+                if len(found["smalls"]) == 2:
+                    marks.append("@small2")
+
+        if classes and el is not row:
+            if "objet-line" in classes and ctx.get("cons_intitule") and "objet_line" not in found:
+                found["objet_line"] = el
+                marks.append("@objet_line")
+            if "cons_intitule" in classes and "cons_intitule" not in found:
+                found["cons_intitule"] = el
+            if "lieux-exe" in classes:
+                found.setdefault("lieux", el)
+
+        for c in marks:
+            ctx[c] = ctx.get(c, 0) + 1
+        stack.append(marks)
+
+    return found
+
+
 # ==========================
 #   Parser principal
 # ==========================
@@ -162,24 +294,19 @@ def parse_maximilien_search_results(html: str) -> List[MaximilienNotice]:
       - la colonne centrale contient référence, intitulé, objet, organisme
       - la colonne de gauche contient procédure, catégorie, date de publication
     """
-    soup = BeautifulSoup(html, "html.parser")
-
     notices: List[MaximilienNotice] = []
 
-    rows = soup.select("div.item_consultation.list-group-item")
-    for row in rows:
+    if not html or not html.strip():
+        return notices
+
+    for row in _iter_rows(html):
+        # Un seul parcours du sous-arbre pour relever tous les noeuds utiles
+        nodes = _scan_row(row)
+
         # ==========================
         # URL & ID source
         # ==========================
-        url = None
-        actions_col = row.select_one("div.col_actions")
-        if actions_col:
-            for a in actions_col.find_all("a"):
-                href = a.get("href", "")
-                if "/entreprise/consultation/" in href:
-                    url = href
-                    break
-
+        url = nodes.get("url")
         if not url:
             # Si on n'a pas d'URL, la notice est difficile à exploiter -> on skip
             continue
@@ -190,34 +317,28 @@ def parse_maximilien_search_results(html: str) -> List[MaximilienNotice]:
         # Procédure & catégorie
         # ==========================
         procedure = None
-        proc_el = row.select_one(".cons_ref .cons_procedure span")
-        if proc_el:
-            procedure = proc_el.get_text(strip=True) or None
+        proc_el = nodes.get("procedure")
+        if proc_el is not None:
+            procedure = _get_text(proc_el, strip=True) or None
 
         category = None
-        cat_el = row.select_one(".cons_ref .cons_categorie span")
-        if cat_el:
-            category = cat_el.get_text(strip=True) or None
+        cat_el = nodes.get("category")
+        if cat_el is not None:
+            category = _get_text(cat_el, strip=True) or None
 
         # ==========================
         # Date de publication
         # ==========================
-        pub_day_el = row.select_one(".cons_ref .date-min .day span") or row.select_one(
-            ".cons_ref .date .day span"
-        )
-        pub_month_el = row.select_one(".cons_ref .date-min .month span") or row.select_one(
-            ".cons_ref .date .month span"
-        )
-        pub_year_el = row.select_one(".cons_ref .date-min .year span") or row.select_one(
-            ".cons_ref .date .year span"
-        )
+        pub_day_el = nodes.get("pub_min_day", nodes.get("pub_day"))
+        pub_month_el = nodes.get("pub_min_month", nodes.get("pub_month"))
+        pub_year_el = nodes.get("pub_min_year", nodes.get("pub_year"))
 
         published_at: Optional[date] = None
-        if pub_day_el and pub_month_el and pub_year_el:
+        if pub_day_el is not None and pub_month_el is not None and pub_year_el is not None:
             published_at = _parse_french_date(
-                pub_day_el.get_text(),
-                pub_month_el.get_text(),
-                pub_year_el.get_text(),
+                _get_text(pub_day_el),
+                _get_text(pub_month_el),
+                _get_text(pub_year_el),
             )
 
         # ==========================
@@ -226,58 +347,57 @@ def parse_maximilien_search_results(html: str) -> List[MaximilienNotice]:
         reference: Optional[str] = None
         title: str = ""
 
-        objet_line = row.select_one(".cons_intitule .objet-line")
-        if objet_line:
+        if "objet_line" in nodes:
             # En général : deux div.small, 1 = référence, 2 = intitulé
-            smalls = objet_line.select("div.small")
+            smalls = nodes["smalls"]
             if len(smalls) >= 1:
-                ref_text = smalls[0].get_text(" ", strip=True)
+                ref_text = _get_text(smalls[0], " ", strip=True)
                 # Souvent "Référence de la consultation : 2025-1234"
                 if ":" in ref_text:
                     ref_text = ref_text.split(":", 1)[1].strip()
                 reference = ref_text or None
 
             if len(smalls) >= 2:
-                span_title = smalls[1].find("span")
-                if span_title:
-                    title = (span_title.get("title") or span_title.get_text() or "").strip()
+                span_title = nodes.get("title_span")
+                if span_title is not None:
+                    title = (span_title.get("title") or _get_text(span_title) or "").strip()
 
         # fallback si jamais pas d'intitulé
         if not title:
             title = reference or ""
 
         # ==========================
-        # Objet
+        # Objet & organisme (acheteur)
         # ==========================
+        # Un seul passage sur les div de l'intitulé : pour chaque libellé, on
+        # garde le premier div qui le contient et tout ce qui suit "Libellé :"
         object_text: Optional[str] = None
-        cons_intitule = row.select_one(".cons_intitule")
-        if cons_intitule:
-            # On cherche un div contenant "Objet :"
-            for div in cons_intitule.find_all("div"):
-                txt = div.get_text(" ", strip=True)
-                if "Objet :" in txt:
-                    # On récupère tout ce qui est après "Objet :"
-                    object_text = txt.split("Objet :", 1)[1].strip() or None
-                    break
-
-        # ==========================
-        # Organisme (acheteur)
-        # ==========================
         buyer: Optional[str] = None
-        if cons_intitule:
-            for div in cons_intitule.find_all("div"):
-                txt = div.get_text(" ", strip=True)
-                if "Organisme :" in txt:
-                    buyer = txt.split("Organisme :", 1)[1].strip() or None
-                    break
+        pending = {"Objet", "Organisme"}
+        cons_intitule = nodes.get("cons_intitule")
+        label_divs = _XP_LABEL_DIVS(cons_intitule) if cons_intitule is not None else []
+        for div in label_divs:
+            txt = _get_text(div, " ", strip=True)
+            for m in _LABEL_RE.finditer(txt):
+                label = m.group(1)
+                if label not in pending:
+                    continue
+                pending.discard(label)
+                value = txt[m.end():].strip() or None
+                if label == "Objet":
+                    object_text = value
+                else:
+                    buyer = value
+            if not pending:
+                break
 
         # ==========================
         # Lieux d'exécution
         # ==========================
         locations: List[str] = []
-        lieux_block = row.select_one(".lieux-exe")
-        if lieux_block:
-            loc_text = lieux_block.get_text(" ", strip=True)
+        lieux_block = nodes.get("lieux")
+        if lieux_block is not None:
+            loc_text = _get_text(lieux_block, " ", strip=True)
             # Souvent "Lieu d'exécution : (78) Yvelines, (92) Hauts-de-Seine"
             if ":" in loc_text:
                 loc_text = loc_text.split(":", 1)[1]
@@ -290,25 +410,17 @@ def parse_maximilien_search_results(html: str) -> List[MaximilienNotice]:
         # ==========================
         # Deadline (date limite)
         # ==========================
-        d_day_el = row.select_one(".cons_dateEnd .cloture-line .date .day span") or row.select_one(
-            ".cons_dateEnd .date .day span"
-        )
-        d_month_el = row.select_one(
-            ".cons_dateEnd .cloture-line .date .month span"
-        ) or row.select_one(".cons_dateEnd .date .month span")
-        d_year_el = row.select_one(
-            ".cons_dateEnd .cloture-line .date .year span"
-        ) or row.select_one(".cons_dateEnd .date .year span")
-        d_time_el = row.select_one(".cons_dateEnd .cloture-line .time label") or row.select_one(
-            ".cons_dateEnd .time label"
-        )
+        d_day_el = nodes.get("dl_cl_day", nodes.get("dl_day"))
+        d_month_el = nodes.get("dl_cl_month", nodes.get("dl_month"))
+        d_year_el = nodes.get("dl_cl_year", nodes.get("dl_year"))
+        d_time_el = nodes.get("time_cl", nodes.get("time"))
 
         deadline: Optional[datetime] = None
-        if d_day_el and d_month_el and d_year_el:
-            d_day = d_day_el.get_text()
-            d_month = d_month_el.get_text()
-            d_year = d_year_el.get_text()
-            d_time = d_time_el.get_text() if d_time_el else ""
+        if d_day_el is not None and d_month_el is not None and d_year_el is not None:
+            d_day = _get_text(d_day_el)
+            d_month = _get_text(d_month_el)
+            d_year = _get_text(d_year_el)
+            d_time = _get_text(d_time_el) if d_time_el is not None else ""
             deadline = _parse_french_datetime(d_day, d_month, d_year, d_time)
 
         # ==========================
@@ -2,33 +2,107 @@
 
 from __future__ import annotations
 
-import json
+import gzip
 import logging
-from dataclasses import asdict
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, BinaryIO, Iterable, Iterator
+
+import ijson
+import orjson
 
 from marches_geometre.models.tender import BoampNotice
 
 logger = logging.getLogger(__name__)
 
+# Niveau de compression des archives .gz (rapide, ratio déjà très bon sur du JSON)
+GZIP_COMPRESSLEVEL = 3
+
 
-def save_notices_to_json(path: Path, notices: Iterable[BoampNotice]) -> None:
+def _open_binary(path: Path, mode: str) -> BinaryIO:
     """
-    Sauvegarde une liste de BoampNotice dans un fichier JSON.
+    Ouvre un fichier en binaire, compressé en gzip si son suffixe est ".gz".
+    """
+    if path.suffix == ".gz":
+        return gzip.open(path, mode, compresslevel=GZIP_COMPRESSLEVEL)
+    return path.open(mode)
 
-    - path : chemin du fichier de sortie
-    - notices : itérable d'instances BoampNotice
 
-    Le JSON contiendra une liste de dicts.
+def save_json_array(path: Path, items: Iterable[Any]) -> None:
     """
-    # On convertit les dataclasses BoampNotice en dicts
-    notices_list: List[dict] = [asdict(n) for n in notices]
+    Écrit un tableau JSON élément par élément (un élément par ligne).
 
+    La liste complète n'est jamais construite : chaque élément est
+    sérialisé puis écrit avant de passer au suivant.
+    Compressé en gzip si path se termine par ".gz".
+    """
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(notices_list, f, ensure_ascii=False, indent=2)
+        with _open_binary(path, "wb") as f:
+            f.write(b"[\n")
+            first = True
+            for item in items:
+                if not first:
+                    f.write(b",\n")
+                f.write(orjson.dumps(item))
+                first = False
+            f.write(b"\n]\n")
     except OSError as exc:
         logger.error("Erreur lors de l'écriture du fichier JSON %s: %s", path, exc)
         raise
+
+
+def save_jsonl(path: Path, items: Iterable[Any]) -> None:
+    """
+    Sauvegarde au format JSON Lines (NDJSON) : un élément JSON par ligne.
+
+    Les fichiers peuvent être concaténés tels quels et restent exploitables
+    s'ils sont tronqués (on perd au plus la dernière ligne).
+    Compressé en gzip si path se termine par ".gz".
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _open_binary(path, "wb") as f:
+            for item in items:
+                f.write(orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE))
+    except OSError as exc:
+        logger.error("Erreur lors de l'écriture du fichier JSONL %s: %s", path, exc)
+        raise
+
+
+def iter_json_array(path: Path) -> Iterator[Any]:
+    """
+    Itère sur les éléments d'un tableau JSON (gzip ou non) au fil de la lecture,
+    sans matérialiser tout le tableau en mémoire.
+    """
+    with _open_binary(path, "rb") as f:
+        yield from ijson.items(f, "item", use_float=True)
+
+
+def iter_jsonl(path: Path) -> Iterator[Any]:
+    """
+    Itère sur les éléments d'un fichier JSON Lines (gzip ou non), ligne à ligne.
+    """
+    with _open_binary(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def iter_json_records(path: Path) -> Iterator[Any]:
+    """
+    Itère sur les enregistrements d'une archive brute, quel que soit son format :
+    JSON Lines (".jsonl", ".jsonl.gz") ou tableau JSON (".json", ".json.gz").
+    """
+    if ".jsonl" in path.suffixes:
+        return iter_jsonl(path)
+    return iter_json_array(path)
+
+
+def save_notices_to_jsonl(path: Path, notices: Iterable[BoampNotice]) -> None:
+    """
+    Sauvegarde des notices (dataclasses) au format JSON Lines, une par ligne.
+
+    - path : chemin du fichier de sortie (".jsonl" ou ".jsonl.gz")
+    - notices : itérable de dataclasses (BoampNotice, AwsNotice...)
+    """
+    save_jsonl(path, notices)
@@ -12,8 +12,18 @@ RAW_MAXIMILIEN_DIR = RAW_DIR / "maximilien"
 
 PROCESSED_DIR = DATA_DIR / "processed"
 
-for d in [RAW_DIR, RAW_AWS_DIR, RAW_BOAMP_DIR, RAW_MAXIMILIEN_DIR, PROCESSED_DIR]:
-    d.mkdir(parents=True, exist_ok=True)
+DATA_DIRS = (RAW_DIR, RAW_AWS_DIR, RAW_BOAMP_DIR, RAW_MAXIMILIEN_DIR, PROCESSED_DIR)
+
+
+def ensure_data_dirs() -> None:
+    """
+    Crée l'arborescence data/ si besoin.
+
+    Appelée une fois par le point d'entrée (run_pipeline) plutôt qu'à
+    chaque import du module.
+    """
+    for d in DATA_DIRS:
+        d.mkdir(parents=True, exist_ok=True)
 
 
 def today_suffix(d: date | None = None) -> str:
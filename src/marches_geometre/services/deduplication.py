@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
 import unicodedata
+from collections import defaultdict
 from dataclasses import replace
-from datetime import datetime, date
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from datetime import date
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from marches_geometre.models.normalized import NormalizedNotice
 
@@ -26,18 +29,22 @@ SOURCE_PRIORITY = {
 #   NORMALISATION TEXTE
 # ---------------------------------------------------------
 
+# Mêmes acheteurs / titres sur de nombreux avis : on mémorise les résultats
+@lru_cache(maxsize=8192)
 def _strip_accents(s: str) -> str:
     return "".join(
         c for c in unicodedata.normalize("NFD", s)
         if unicodedata.category(c) != "Mn"
     )
 
+@lru_cache(maxsize=8192)
 def _normalize(s: Optional[str]) -> str:
     if not s:
         return ""
     s = _strip_accents(s.lower())
     s = re.sub(r"[^\w\s]", " ", s)
-    return " ".join(s.split())
+    # interné : les signatures identiques partagent la même chaîne
+    return sys.intern(" ".join(s.split()))
 
 def _canonical_url(url: Optional[str]) -> str:
     if not url:
@@ -47,12 +54,18 @@ def _canonical_url(url: Optional[str]) -> str:
     url = re.sub(r"\?.*$", "", url)
     return url
 
+# "YYYY-MM-DD" en tête de chaîne (plus rapide que strptime)
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
 def _parse_date(d: Optional[str]) -> Optional[date]:
     if not d:
         return None
+    m = _DATE_RE.match(d)
+    if not m:
+        return None
     try:
-        return datetime.strptime(d, "%Y-%m-%d").date()
-    except:
+        return date(int(m[1]), int(m[2]), int(m[3]))
+    except ValueError:
         return None
 
 def _date_close(d1: Optional[str], d2: Optional[str], tol: int = 3) -> bool:
@@ -62,11 +75,21 @@ def _date_close(d1: Optional[str], d2: Optional[str], tol: int = 3) -> bool:
         return False
     return abs((a - b).days) <= tol
 
-def _jaccard(a: str, b: str) -> float:
-    A = set(_normalize(a).split())
-    B = set(_normalize(b).split())
+@lru_cache(maxsize=8192)
+def _tokens(normalized: str) -> FrozenSet[str]:
+    """
+    Mots d'un texte déjà normalisé. Mémorisé : deux titres normalisés
+    identiques partagent le même frozenset.
+    """
+    return frozenset(normalized.split())
+
+def _jaccard(A: FrozenSet[str], B: FrozenSet[str]) -> float:
+    """ Similarité de Jaccard entre deux ensembles de mots déjà normalisés. """
     if not A or not B:
         return 0.0
+    # même objet (cf. _tokens) : inutile de calculer intersection et union
+    if A is B:
+        return 1.0
     return len(A & B) / len(A | B)
 
 # ---------------------------------------------------------
@@ -87,10 +110,19 @@ def _merge_group(group: List[NormalizedNotice]) -> NormalizedNotice:
     best = _choose_best(group)
     merged = replace(best)
 
+    # un seul passage sur le groupe pour les trois ensembles
+    sources, urls, refs = set(), set(), set()
+    for n in group:
+        sources.add(n.source)
+        if n.url != best.url:
+            urls.add(n.url)
+        if n.reference != best.reference:
+            refs.add(n.reference)
+
     extra = dict(best.extra or {})
-    extra["merged_sources"] = sorted({n.source for n in group})
-    extra["other_urls"] = sorted({n.url for n in group if n.url != best.url})
-    extra["other_refs"] = sorted({n.reference for n in group if n.reference != best.reference})
+    extra["merged_sources"] = sorted(sources)
+    extra["other_urls"] = sorted(urls)
+    extra["other_refs"] = sorted(refs)
 
     merged.extra = extra
     return merged
@@ -140,17 +172,19 @@ def deduplicate_notices(notices: List[NormalizedNotice]) -> List[NormalizedNotic
     # ---------------------------------------------
     # 2) Groupement par signature douce (multi-source ONLY)
     # ---------------------------------------------
-    buckets: Dict[Tuple[str, str, str, str], List[NormalizedNotice]] = {}
+    final = []
+
+    buckets: Dict[Tuple[str, str, str, str], List[NormalizedNotice]] = defaultdict(list)
+    # mots du titre normalisé, calculés une seule fois par avis (clé : id(n))
+    title_tokens: Dict[int, FrozenSet[str]] = {}
     for n in after_strict:
         sig = _soft_signature(n)
-        # si le titre ou acheteur vide, ne pas fusionner
+        # si le titre ou acheteur vide, ne pas fusionner : conservé tel quel
         if not sig[0] or not sig[1]:
-            # clé unique => on ne fusionnera pas
-            buckets.setdefault((f"unique_{id(n)}", "", "", ""), []).append(n)
-        else:
-            buckets.setdefault(sig, []).append(n)
-
-    final = []
+            final.append(n)
+            continue
+        title_tokens[id(n)] = _tokens(sig[0])
+        buckets[sig].append(n)
 
     for sig, group in buckets.items():
 
@@ -166,10 +200,10 @@ def deduplicate_notices(notices: List[NormalizedNotice]) -> List[NormalizedNotic
             continue
 
         # test de similarité
-        base = group[0].title or ""
+        base = title_tokens[id(group[0])]
         ok = True
         for n in group[1:]:
-            if _jaccard(base, n.title or "") < 0.85:
+            if _jaccard(base, title_tokens[id(n)]) < 0.85:
                 ok = False
                 break
 
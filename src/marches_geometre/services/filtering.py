@@ -2,26 +2,39 @@
 
 from __future__ import annotations
 
+import re
+import unicodedata
 from datetime import date, datetime, timedelta
-from typing import List, Set, Optional
+from typing import Callable, List, Set, Optional
 
 from marches_geometre.models.tender import BoampNotice
 
-# Mots-clés "métier" pour un cabinet de géomètre-expert
-GEOMETER_KEYWORDS: List[str] = [
+
+def strip_accents(s: str) -> str:
+    """
+    "état descriptif" -> "etat descriptif"
+    """
+    return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
+
+
+# Mots-clés "métier" pour un cabinet de géomètre-expert (orthographe de référence)
+_BASE_KEYWORDS: List[str] = [
     "géomètre",
     "géomètre-expert",
-    "geometre",
-    "geometre-expert",
     "topographie",
     "topographique",
     "bornage",
     "plan de division",
     "état descriptif de division",
-    "etat descriptif de division",
     "EDD",
 ]
 
+# Liste unique partagée par tous les collecteurs : orthographes de référence
+# + variantes sans accents (ex: "geometre"), générées une fois à l'import
+GEOMETER_KEYWORDS: List[str] = list(
+    dict.fromkeys([*_BASE_KEYWORDS, *map(strip_accents, _BASE_KEYWORDS)])
+)
+
 # Départements ciblés pour ton client (à ajuster si besoin)
 TARGET_DEPARTMENTS: Set[str] = {"78", "92", "95"}
 
@@ -63,21 +76,23 @@ def is_notice_services_market(notice: BoampNotice) -> bool:
     """
     fields = notice.raw_fields or {}
 
-    type_marche = (fields.get("type_marche") or "").upper()
-    type_marche_facette = (fields.get("type_marche_facette") or "").upper()
-
-    if "SERVICE" in type_marche:
-        return True
-    if "SERVICE" in type_marche_facette:
+    # La facette n'est examinée que si type_marche ne suffit pas
+    type_marche = fields.get("type_marche")
+    if type_marche and "SERVICE" in type_marche.upper():
         return True
 
-    return False
+    type_marche_facette = fields.get("type_marche_facette")
+    return bool(type_marche_facette and "SERVICE" in type_marche_facette.upper())
 
 
 # ==========================
 # Filtres temporels (publication + AO en cours)
 # ==========================
 
+# "YYYY-MM-DD" en tête de chaîne, avec ou sans partie horaire
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+
 def _parse_date(value: Optional[str]) -> Optional[date]:
     """
     Parse une date provenant de BOAMP.
@@ -96,6 +111,15 @@ def _parse_date(value: Optional[str]) -> Optional[date]:
     if not value:
         return None
 
+    # Chemin rapide : la date calendaire est toujours en tête de chaîne,
+    # y compris pour "YYYY-MM-DDTHH:MM:SS+02:00" (on garde la date locale)
+    m = _DATE_RE.match(value)
+    if m:
+        try:
+            return date(int(m[1]), int(m[2]), int(m[3]))
+        except ValueError:
+            return None
+
     try:
         # Si la chaîne contient une partie horaire
         if "T" in value:
@@ -110,6 +134,37 @@ def _parse_date(value: Optional[str]) -> Optional[date]:
         return None
 
 
+def _is_recent_and_open(notice: BoampNotice, today: date, min_pub_date: date) -> bool:
+    pub_date = _parse_date(notice.publication_date)
+    if pub_date is None or pub_date < min_pub_date:
+        return False
+
+    deadline = _parse_date(notice.application_deadline)
+    if deadline is None or deadline < today:
+        return False
+
+    return True
+
+
+def make_recent_open_filter(days: int = 120) -> Callable[[BoampNotice], bool]:
+    """
+    Construit le prédicat "publié récemment et toujours en cours".
+
+    La date du jour et la date de publication minimale sont calculées une
+    seule fois ici, pas à chaque avis testé :
+
+        is_recent_open = make_recent_open_filter(days=120)
+        recent = [n for n in notices if is_recent_open(n)]
+    """
+    today = date.today()
+    min_pub_date = today - timedelta(days=days)
+
+    def is_recent_open(notice: BoampNotice) -> bool:
+        return _is_recent_and_open(notice, today, min_pub_date)
+
+    return is_recent_open
+
+
 def is_notice_recent_and_open(notice: BoampNotice, days: int = 120) -> bool:
     """
     Vérifie deux conditions temporelles :
@@ -119,16 +174,9 @@ def is_notice_recent_and_open(notice: BoampNotice, days: int = 120) -> bool:
        (on considère l'AO "en cours" si date limite >= aujourd'hui).
 
     Si une des infos est manquante ou invalide -> False (par sécurité).
+
+    Pour filtrer une liste, préférer make_recent_open_filter (dates calculées
+    une seule fois).
     """
     today = date.today()
-    min_pub_date = today - timedelta(days=days)
-
-    pub_date = _parse_date(notice.publication_date)
-    if pub_date is None or pub_date < min_pub_date:
-        return False
-
-    deadline = _parse_date(notice.application_deadline)
-    if deadline is None or deadline < today:
-        return False
-
-    return True
+    return _is_recent_and_open(notice, today, today - timedelta(days=days))
@@ -2,18 +2,28 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional, Sequence, TypeVar
 
 from marches_geometre.models.tender import BoampNotice, AwsNotice
 from marches_geometre.models.normalized import NormalizedNotice
 from marches_geometre.parsers.maximilien import MaximilienNotice
+from marches_geometre.persistence.json_store import iter_json_records
 
 logger = logging.getLogger(__name__)
 
+# En dessous de ce nombre d'avis, le coût de démarrage des process
+# dépasse le gain : on reste en séquentiel.
+PARALLEL_MIN_NOTICES = 1000
+PARALLEL_CHUNKSIZE = 256
+
+T = TypeVar("T")
+
 # =========================
 # Helpers dates
 # =========================
@@ -79,6 +89,15 @@ def _extract_department_from_locations(locations: Optional[List[str]]) -> Option
     return None
 
 
+def _intern(value: Optional[str]) -> Optional[str]:
+    """
+    Interne les petites chaînes très répétées (codes département...) : une
+    seule instance en mémoire et des comparaisons de clés par identité lors
+    du dédoublonnage.
+    """
+    return sys.intern(value) if value else value
+
+
 # =========================
 # Converters
 # =========================
@@ -108,7 +127,7 @@ def normalize_boamp_notice(n: BoampNotice) -> NormalizedNotice:
         title=title,
         description=description,
         buyer_name=n.buyer_name,
-        department=n.department,
+        department=_intern(n.department),
         city=n.city,
         postal_code=n.postal_code,
         publication_date=publication_date,
@@ -149,7 +168,7 @@ def normalize_aws_notice(
         title=n.object or n.reference,
         description=n.object,
         buyer_name=(n.buyer_name.strip() if n.buyer_name else None),
-        department=department,
+        department=_intern(department),
         city=None,             # pas dispo dans la liste
         postal_code=None,      # idem
         publication_date=publication_date,
@@ -209,7 +228,7 @@ def normalize_maximilien_notice(n: MaximilienNotice) -> NormalizedNotice:
         title=getattr(n, "title", None),
         description=getattr(n, "object", None),
         buyer_name=getattr(n, "buyer", None),
-        department=department,
+        department=_intern(department),
         city=None,
         postal_code=None,
         publication_date=publication_date,
@@ -232,10 +251,13 @@ def normalize_maximilien_notice(n: MaximilienNotice) -> NormalizedNotice:
 
 def load_maximilien_notices(path: Path) -> List[MaximilienNotice]:
     """
-    Charge un fichier JSON Maximilien (liste de dicts) en liste de MaximilienNotice.
+    Charge un fichier JSON Maximilien en liste de MaximilienNotice.
+
+    Accepte le format JSON Lines (.jsonl / .jsonl.gz) comme l'ancien tableau
+    JSON (.json / .json.gz). Les avis sont lus un par un, sans charger
+    tout le fichier.
     """
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return [MaximilienNotice(**item) for item in data]
+    return [MaximilienNotice(**item) for item in iter_json_records(path)]
 
 
 # =========================
@@ -252,24 +274,37 @@ def normalize_all(
 ) -> List[NormalizedNotice]:
     """
     Concatène les listes BOAMP + AWS (+ Maximilien) dans un seul flux normalisé.
-    """
-    normalized: List[NormalizedNotice] = []
-
-    for n in boamp_notices:
-        normalized.append(normalize_boamp_notice(n))
 
-    for n in aws_notices:
-        normalized.append(normalize_aws_notice(n, department=aws_department))
-
-    if maximilien_notices:
-        for n in maximilien_notices:
-            normalized.append(normalize_maximilien_notice(n))
+    Au-delà de PARALLEL_MIN_NOTICES avis, la conversion (indépendante d'un
+    avis à l'autre) est répartie sur plusieurs process ; l'ordre est conservé.
+    """
+    maximilien_notices = maximilien_notices or []
+    normalize_aws = partial(normalize_aws_notice, department=aws_department)
+
+    total = len(boamp_notices) + len(aws_notices) + len(maximilien_notices)
+    if total < PARALLEL_MIN_NOTICES:
+        normalized: List[NormalizedNotice] = [normalize_boamp_notice(n) for n in boamp_notices]
+        normalized.extend(normalize_aws(n) for n in aws_notices)
+        normalized.extend(normalize_maximilien_notice(n) for n in maximilien_notices)
+    else:
+        with ProcessPoolExecutor() as executor:
+            def run(func: Callable[[T], NormalizedNotice], items: Sequence[T]) -> List[NormalizedNotice]:
+                return list(executor.map(func, items, chunksize=PARALLEL_CHUNKSIZE))
+
+            normalized = run(normalize_boamp_notice, boamp_notices)
+            normalized += run(normalize_aws, aws_notices)
+            normalized += run(normalize_maximilien_notice, maximilien_notices)
+
+        # Les avis reviennent des workers par pickle, avec leurs propres copies
+        # des chaînes : on ré-interne ici pour retrouver le partage (cf. _intern)
+        for n in normalized:
+            n.department = _intern(n.department)
 
     logger.info(
         "Normalisation terminée : %d BOAMP + %d AWS + %d Maximilien -> %d avis",
         len(boamp_notices),
         len(aws_notices),
-        len(maximilien_notices or []),
+        len(maximilien_notices),
         len(normalized),
     )
     return normalized